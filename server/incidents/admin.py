@@ -2,9 +2,19 @@ import typing as t
 
 from django import forms
 from django.contrib import admin
+from django.contrib.admin.utils import lookup_spawns_duplicates
+from django.contrib.admin.views.main import PAGE_VAR, ChangeList
 from django.contrib.auth.models import Group
+from django.contrib.postgres.search import SearchQuery
+from django.core.exceptions import FieldDoesNotExist
 from django.core.files import File
-from django.utils.safestring import mark_safe
+from django.core.paginator import Paginator
+from django.db import connection, connections
+from django.db.models import Q, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+from django.utils.functional import cached_property
+from django.utils.html import format_html
+from django.utils.text import smart_split, unescape_string_literal
 
 from server.admin import admin_site
 
@@ -23,11 +33,200 @@ from .models import (
     SupportingMaterial,
 )
 
+# Change form URLs for the admin links rendered in changelists.
+_SCHOOL_CHANGE_URL = "/admin/incidents/school/{}/change/"
+_DISTRICT_CHANGE_URL = "/admin/incidents/schooldistrict/{}/change/"
+
 # -----------------------------------------------------------------------------
 # Abstract base admin classes
 # -----------------------------------------------------------------------------
 
 
+class EstimatedCountPaginator(Paginator):
+    """
+    A paginator that avoids counting large, unfiltered tables.
+
+    PostgreSQL must scan a whole table to answer `SELECT COUNT(*)`. For an
+    unfiltered changelist over a large table we use the planner's row
+    estimate instead; small tables and filtered querysets get an exact count.
+
+    The estimate can lag the table, so it's never allowed to be too small to
+    contain `page_number`, the page about to be displayed.
+    """
+
+    # Below this many (estimated) rows, an exact count is cheap enough.
+    ESTIMATE_THRESHOLD = 10_000
+
+    def __init__(self, *args, page_number: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.page_number = page_number
+
+    @cached_property
+    def count(self) -> int:
+        estimate = self._estimated_count()
+        if estimate is None or estimate <= self.ESTIMATE_THRESHOLD:
+            return super().count
+        return max(estimate, (self.page_number - 1) * self.per_page + 1)
+
+    def _estimated_count(self) -> int | None:
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet) or queryset.query.where:
+            return None
+        db = connections[queryset.db]
+        if db.vendor != "postgresql":
+            return None
+        with db.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 (or, before PostgreSQL 14, 0) for tables that have
+        # never been analyzed; count those exactly rather than trust it
+        if row is None or row[0] <= 0:
+            return None
+        return int(row[0])
+
+
+class ChangeListBase(ChangeList):
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        list_only = getattr(self.model_admin, "list_only", ())
+        if list_only:
+            queryset = queryset.only(*list_only)
+        list_prefetch_related = getattr(self.model_admin, "list_prefetch_related", ())
+        if list_prefetch_related:
+            queryset = queryset.prefetch_related(*list_prefetch_related)
+        return queryset
+
+
+class ModelAdminBase(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    # Don't issue a second, unfiltered COUNT(*) when a filter is applied.
+    show_full_result_count = False
+
+    # If set, the changelist only fetches these columns. Change views still
+    # load whole rows.
+    list_only: tuple[str, ...] = ()
+
+    def get_changelist(self, request, **kwargs):
+        return ChangeListBase
+
+    def get_paginator(self, request, queryset, per_page, **kwargs):
+        # Parsed as ChangeList parses it, so the count covers the page shown
+        try:
+            page_number = int(request.GET.get(PAGE_VAR, 1))
+        except ValueError:
+            page_number = 1
+        return self.paginator(queryset, per_page, page_number=page_number, **kwargs)
+
+    # Unless list_select_related is given explicitly, the changelist joins
+    # (or, for multi-valued relations, prefetches) every relation reached by
+    # a `__` path in list_display, list_only, or a display method's ordering.
+    # This keeps callables like `obj.school.name` from costing a query per row.
+
+    def _list_relation_paths(self) -> t.Iterator[str]:
+        for item in self.list_display:
+            if isinstance(item, str) and hasattr(self, item):
+                item = getattr(self, item)
+            ordering = getattr(item, "admin_order_field", None)
+            if isinstance(ordering, str):
+                yield ordering.lstrip("-")
+            elif isinstance(item, str):
+                yield item
+        yield from self.list_only
+
+    @cached_property
+    def _list_relations(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        select_related: list[str] = []
+        prefetch_related: list[str] = []
+        for path in self._list_relation_paths():
+            model = self.model
+            parts: list[str] = []
+            for name in path.split(LOOKUP_SEP):
+                try:
+                    field = model._meta.get_field(name)
+                except FieldDoesNotExist:
+                    break
+                if not field.is_relation:
+                    break
+                parts.append(name)
+                if field.many_to_many or field.one_to_many:
+                    related = prefetch_related
+                    break
+                related = select_related
+                model = field.related_model
+            if parts:
+                relation = LOOKUP_SEP.join(parts)
+                if relation not in related:
+                    related.append(relation)
+        return tuple(select_related), tuple(prefetch_related)
+
+    def get_list_select_related(self, request):
+        if self.list_select_related is not False:
+            return self.list_select_related
+        return self._list_relations[0] or False
+
+    @property
+    def list_prefetch_related(self) -> tuple[str, ...]:
+        return self._list_relations[1]
+
+    # On PostgreSQL, the model's `search` vector covers these search fields,
+    # so they're matched with one GIN index lookup instead of an ILIKE each.
+    # Terms match as word prefixes ("Belle" finds "Bellevue"), but not in the
+    # middle of a word; fields that need substring matches stay out of it.
+    search_vector_fields: tuple[str, ...] = ()
+    search_vector_config = "english"
+
+    def _uses_search_vector(self) -> bool:
+        return bool(self.search_vector_fields) and connection.vendor == "postgresql"
+
+    def get_search_fields(self, request):
+        search_fields = super().get_search_fields(request)
+        if not self._uses_search_vector():
+            return search_fields
+        return tuple(f for f in search_fields if f not in self.search_vector_fields)
+
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = self._get_search_results(
+            request, queryset, search_term
+        )
+        # A bare number may also be an id; match it by primary key, alongside
+        # the text search, rather than as a pattern over CAST(id AS text),
+        # which can't use an index.
+        search_term = search_term.strip()
+        if search_term.isascii() and search_term.isdigit():
+            results |= queryset.filter(pk=int(search_term))
+        return results, may_have_duplicates
+
+    def _get_search_results(self, request, queryset, search_term):
+        if not self._uses_search_vector():
+            return super().get_search_results(request, queryset, search_term)
+        # As with the default implementation, every term must match somewhere:
+        # either the search vector, or one of the remaining search fields.
+        search_fields = self.get_search_fields(request)
+        lookups = [f"{field}__icontains" for field in search_fields]
+        for term in smart_split(search_term):
+            if term.startswith(('"', "'")) and term[0] == term[-1]:
+                term = unescape_string_literal(term)
+            q = Q(search=self._prefix_query(term))
+            for lookup in lookups:
+                q |= Q(**{lookup: term})
+            queryset = queryset.filter(q)
+        may_have_duplicates = any(
+            lookup_spawns_duplicates(self.opts, field) for field in search_fields
+        )
+        return queryset, may_have_duplicates
+
+    def _prefix_query(self, term: str) -> SearchQuery:
+        # Quoted, the term is one operand however it's punctuated; inside
+        # quotes, tsquery syntax escapes with a backslash.
+        escaped = term.replace("\\", "\\\\").replace("'", "\\'")
+        return SearchQuery(
+            f"'{escaped}':*", config=self.search_vector_config, search_type="raw"
+        )
+
+
 class AttachmentFormBase(forms.ModelForm):
     """Arbitrary attachment form."""
 
@@ -42,11 +241,17 @@ class AttachmentFormBase(forms.ModelForm):
 
     def save(self, *args: t.Any, **kwargs: t.Any):
         """Save the form."""
+        # Attachment querysets defer `data`; it is only written (and never read)
+        # here, when a new file has been uploaded. Otherwise, saving a
+        # deferred instance leaves the existing blob untouched.
         choose_file = self.cleaned_data.pop("choose_file", None)
         if choose_file is not None:
             assert isinstance(choose_file, File)
             self.instance.name = choose_file.name
-            self.instance.data = choose_file.read()
+            # Large uploads are spooled to a temporary file by Django. The
+            # whole file is still buffered in memory here, since the blob is
+            # written to the database in one piece.
+            self.instance.set_data(b"".join(choose_file.chunks()))
         return super().save(*args, **kwargs)
 
 
@@ -61,8 +266,12 @@ class AttachmentAdminBase(admin.TabularInline):
         if obj.url is None:
             return ""
         if obj.is_image:
-            return mark_safe(f'<img src="{obj.url}" style="max-width: 72px;">')
-        return mark_safe(f'<a href="{obj.url}">{obj.name}</a>')
+            # Each thumbnail is a separate request that pulls the whole blob
+            # out of the database; only fetch the ones that scroll into view.
+            return format_html(
+                '<img src="{}" loading="lazy" style="max-width: 72px;">', obj.url
+            )
+        return format_html('<a href="{}">{}</a>', obj.url, obj.name)
 
 
 class ExtraAdminBase(admin.TabularInline):
@@ -76,9 +285,9 @@ class ExtraAdminBase(admin.TabularInline):
 # -----------------------------------------------------------------------------
 
 
-class RegionAdmin(admin.ModelAdmin):
+class RegionAdmin(ModelAdminBase):
     list_display = ("name",)
-    search_fields = ("id", "name")
+    search_fields = ("name",)
     readonly_fields = ("group",)
 
     def save_model(self, request, obj: Region, form, change):
@@ -91,11 +300,11 @@ class RegionAdmin(admin.ModelAdmin):
         # Save the region
         super().save_model(request, obj, form, change)
 
-        # If we're changing the region, we need to make sure the group name is in sync
-        if change:
+        # If we renamed the region, we need to make sure the group name is in sync
+        if change and "name" in form.changed_data:
             group = obj.group
             group.name = Region.default_group_name(obj.name)
-            group.save()
+            group.save(update_fields=["name"])
 
 
 # -----------------------------------------------------------------------------
@@ -114,10 +323,9 @@ class DistrictLogoAdmin(AttachmentAdminBase):
     extra = 0
 
 
-class SchoolDistrictAdmin(admin.ModelAdmin):
+class SchoolDistrictAdmin(ModelAdminBase):
     list_display = ("name", "url")
     search_fields = (
-        "id",
         "name",
         "phone",
         "superintendent_name",
@@ -127,10 +335,20 @@ class SchoolDistrictAdmin(admin.ModelAdmin):
         "hib_contact_name",
         "hib_contact_email",
     )
+    # The district name, phone numbers and emails (a mailbox or a domain) are
+    # searched by substring, which the search vector's prefix matching can't
+    # do; the name has a trigram index for it. Contact names match by word.
+    search_vector_fields = (
+        "superintendent_name",
+        "civil_rights_contact_name",
+        "hib_contact_name",
+    )
+    search_vector_config = "simple"
+    list_only = ("name", "url")
     inlines = [DistrictLogoAdmin]
 
 
-class SchoolAdmin(admin.ModelAdmin):
+class SchoolAdmin(ModelAdminBase):
     list_display = (
         "name",
         "city",
@@ -141,17 +359,28 @@ class SchoolAdmin(admin.ModelAdmin):
         "is_high",
         "district_link",
     )
-    search_fields = ("id", "name", "url", "district__name", "city", "state")
+    search_fields = ("name", "url", "district__name", "city", "state")
+    list_only = (
+        "name",
+        "city",
+        "state",
+        "is_public",
+        "is_elementary",
+        "is_middle",
+        "is_high",
+        "district__name",
+    )
 
+    @admin.display(description="District", ordering="district__name")
     def district_link(self, obj):
-        if not obj.district:
+        if obj.district_id is None:
             return ""
-        return mark_safe(
-            f'<a href="/admin/incidents/schooldistrict/{obj.district.id}/change/">{obj.district.name}</a>'
+        return format_html(
+            '<a href="{}">{}</a>',
+            _DISTRICT_CHANGE_URL.format(obj.district_id),
+            obj.district.name,
         )
 
-    district_link.allow_tags = True
-
 
 # -----------------------------------------------------------------------------
 # Concrete admin classes: Incident & related models
@@ -165,11 +394,11 @@ class RelatedLinkAdmin(admin.TabularInline):
     extra = 0
 
 
-class IncidentTypeAdmin(admin.ModelAdmin):
+class IncidentTypeAdmin(ModelAdminBase):
     list_display = ("name", "description")
 
 
-class SourceTypeAdmin(admin.ModelAdmin):
+class SourceTypeAdmin(ModelAdminBase):
     list_display = ("name", "description")
 
 
@@ -197,23 +426,31 @@ class IncidentExtraAdmin(ExtraAdminBase):
     model = IncidentExtra
 
 
-class IncidentAdmin(admin.ModelAdmin):
+class IncidentAdmin(ModelAdminBase):
     list_display = (
         "id",
         "occurred_at",
         "published_at",
-        "incident_types_list",
-        "source_types_list",
+        "incident_types_cache",
+        "source_types_cache",
         "description_short",
         "school_link",
     )
     search_fields = (
-        "id",
         "description",
         "school__name",
         "school__city",
         "school__state",
     )
+    search_vector_fields = ("description",)
+    list_only = (
+        "occurred_at",
+        "published_at",
+        "incident_types_cache",
+        "source_types_cache",
+        "description_prefix",
+        "school__name",
+    )
     inlines = [
         SupportingMaterialAdmin,
         SchoolResponseMaterialAdmin,
@@ -221,28 +458,21 @@ class IncidentAdmin(admin.ModelAdmin):
         IncidentExtraAdmin,
     ]
 
-    def incident_types_list(self, obj):
-        return ", ".join(
-            [incident_type.name for incident_type in obj.incident_types.all()]
-        )
-
-    def source_types_list(self, obj):
-        return ", ".join([source_type.name for source_type in obj.source_types.all()])
-
     def description_short(self, obj):
         return (
-            obj.description[:50] + "..."
-            if len(obj.description) > 50
-            else obj.description
+            obj.description_prefix[:50] + "..."
+            if len(obj.description_prefix) > 50
+            else obj.description_prefix
         )
 
+    @admin.display(description="School", ordering="school__name")
     def school_link(self, obj):
-        return mark_safe(
-            f'<a href="/admin/incidents/school/{obj.school.id}/change/">{obj.school.name}</a>'
+        return format_html(
+            '<a href="{}">{}</a>',
+            _SCHOOL_CHANGE_URL.format(obj.school_id),
+            obj.school.name,
         )
 
-    school_link.allow_tags = True
-
 
 admin_site.register(Region, RegionAdmin)
 admin_site.register(SchoolDistrict, SchoolDistrictAdmin)
@@ -5,3 +5,6 @@ class IncidentsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     label = "incidents"
     name = "server.incidents"
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,29 +1,18 @@
 import datetime
+import functools
+import re
 import typing as t
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from django import forms
 from django.core.exceptions import ValidationError
 from django.db import models
 
+# "YYYY", "YYYY-MM", or "YYYY-MM-DD", with ASCII digits only.
+_PARTIAL_DATE_RE = re.compile(r"\A([0-9]{4})(?:-([0-9]{2})(?:-([0-9]{2}))?)?\Z")
 
-def _check_int(value: str, expected_length: int) -> int:
-    """Ensure that `value` is a valid integer of length `expected_length`."""
-    if not value.isdigit():
-        raise ValidationError("Invalid integer")
-    if len(value) != expected_length:
-        raise ValidationError(f"Invalid integer length; expected {expected_length}")
-    return int(value)
 
-
-def _check_optional_int(value: str | None, expected_length: int) -> int | None:
-    """Ensure that `value` is a valid integer of length `expected_length`, or None."""
-    if value is None:
-        return None
-    return _check_int(value, expected_length)
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PartialDate:
     """
     A partial date, with support for:
@@ -40,6 +29,9 @@ class PartialDate:
     month: int | None
     day: int | None
 
+    # The formatted string, computed once since instances are immutable.
+    _str: str = field(init=False, repr=False, compare=False)
+
     def __post_init__(self):
         """Validate the partial date."""
         if self.month is None and self.day is not None:
@@ -59,6 +51,7 @@ class PartialDate:
                 datetime.date(self.year, self.month, self.day)
             except ValueError:
                 raise ValidationError("Invalid date")
+        object.__setattr__(self, "_str", self._format())
 
     @classmethod
     def from_str(cls, value: str) -> t.Self:
@@ -67,22 +60,56 @@ class PartialDate:
 
         The string should be in the format "", "YYYY", "YYYY-MM", or "YYYY-MM-DD".
         """
+        return cls._from_str_cached(value)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _from_str_cached(cls, value: str) -> t.Self:
+        # PartialDate is immutable, so the same instance can safely be handed
+        # out for every occurrence of a given date (e.g. one per row loaded).
         if not value:
             return cls(year=None, month=None, day=None)
-        parts = value.split("-")
-        y_str, m_str, d_str = parts[0], None, None
-        if len(parts) > 1:
-            m_str = parts[1]
-        if len(parts) > 2:
-            d_str = parts[2]
-        if len(parts) > 3:
-            raise ValidationError("Invalid date format")
-        y, m, d = (
-            _check_int(y_str, 4),
-            _check_optional_int(m_str, 2),
-            _check_optional_int(d_str, 2),
+        match = _PARTIAL_DATE_RE.match(value)
+        if match is None:
+            raise ValidationError(
+                "Invalid date format; expected YYYY, YYYY-MM, or YYYY-MM-DD"
+            )
+        y, m, d = match.groups()
+        return cls(
+            year=int(y),
+            month=int(m) if m else None,
+            day=int(d) if d else None,
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _from_db(cls, value: str) -> t.Self:
+        """
+        Convert a value loaded from the database to a PartialDate.
+
+        Values in the database were written by get_prep_value(), so they're
+        already well-formed: the parts are sliced out by position, and not
+        re-validated. For any string from_str() accepts, the result is equal
+        to from_str()'s; anything else is not rejected, but misread (e.g.
+        "2024-01-15-01" loads as 2024-01-15, and "24" as the year 24).
+        """
+        if not value:
+            return cls._trusted(None, None, None)
+        return cls._trusted(
+            int(value[0:4]),
+            int(value[5:7]) if len(value) > 4 else None,
+            int(value[8:10]) if len(value) > 7 else None,
         )
-        return cls(year=y, month=m, day=d)
+
+    @classmethod
+    def _trusted(cls, year: int | None, month: int | None, day: int | None) -> t.Self:
+        """Construct a PartialDate from known-valid parts, bypassing validation."""
+        self = object.__new__(cls)
+        object.__setattr__(self, "year", year)
+        object.__setattr__(self, "month", month)
+        object.__setattr__(self, "day", day)
+        object.__setattr__(self, "_str", self._format())
+        return self
 
     @classmethod
     def from_date(cls, date: datetime.date) -> t.Self:
@@ -95,6 +122,9 @@ class PartialDate:
 
         The string will be in the format "", "YYYY", "YYYY-MM", or "YYYY-MM-DD".
         """
+        return self._str
+
+    def _format(self) -> str:
         if self.year is None:
             return ""
         if self.month is None:
@@ -139,7 +169,7 @@ class PartialDateField(models.CharField):
         return PartialDate.from_str(value)
 
     def from_db_value(self, value: str, expression, connection) -> PartialDate:
-        return self.to_python(value)
+        return PartialDate._from_db(value)
 
     def get_prep_value(self, value: PartialDate) -> str:
         return str(value)
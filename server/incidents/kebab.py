@@ -1,22 +1,21 @@
+import functools
+import re
+
+# NOTE: both conversions are applied to a small, repeating set of model names
+# (to build and resolve attachment URLs), so their results are memoized.
+
+# Matches the (empty) position before each uppercase letter, except the first.
+_WORD_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+@functools.lru_cache(maxsize=256)
 def pascal_to_kebab(s: str) -> str:
     """Convert a string of the form 'SomeThing' to 'some-thing'."""
-    # Split the string into words.
-    words = []
-    word = ""
-    for c in s:
-        if c.isupper():
-            # Start a new word.
-            if word:
-                words.append(word)
-            word = c.lower()
-        else:
-            word += c
-    if word:
-        words.append(word)
-    # Join the words with hyphens.
-    return "-".join(words)
+    # Hyphenate at each word boundary, then lowercase the whole thing.
+    return _WORD_BOUNDARY_RE.sub("-", s).lower()
 
 
+@functools.lru_cache(maxsize=256)
 def kebab_to_pascal(s: str) -> str:
     """Convert a string of the form 'some-thing' to 'SomeThing'."""
     # Split the string into words.
@@ -1,11 +1,19 @@
+import contextlib
 import csv
 import datetime
+import functools
+import hashlib
 import pathlib
+import re
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 import zoneinfo
 from django.contrib.auth.models import User
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, models, transaction
 
 from server.incidents.fields import PartialDate
 from server.incidents.models import (
@@ -25,6 +33,114 @@ from server.incidents.models import (
 # we can call it a day and never use it again. It's not meant to be pretty or
 # efficient, just functional.
 
+# AirTable exports timestamps in Seattle local time
+PACIFIC = zoneinfo.ZoneInfo("America/Los_Angeles")
+
+# The two name-only lookup models that incidents have M2Ms to
+_TypeModel = t.TypeVar("_TypeModel", IncidentType, SourceType)
+
+
+# strptime()'s own patterns for %m, %d, %Y, %I, %M, and %p; like it, a space
+# matches any run of whitespace, and case is ignored.
+LAST_MODIFIED_PATTERN = re.compile(
+    r"(?P<month>1[0-2]|0[1-9]|[1-9])/(?P<day>3[01]|[12]\d|0[1-9]|[1-9]| [1-9])"
+    r"/(?P<year>\d\d\d\d)\s+(?P<hour>1[0-2]|0[1-9]|[1-9]):(?P<minute>[0-5]\d|\d)"
+    r"(?P<am_pm>am|pm)",
+    re.IGNORECASE,
+)
+
+
+def parse_last_modified(value: str) -> datetime.datetime:
+    """
+    Parse a timestamp in the format "M/DD/YYYY HH:MMam/pm", in Pacific time.
+
+    This accepts exactly what strptime() with "%m/%d/%Y %I:%M%p" does, but is
+    much faster for the one fixed format we need.
+    """
+    match = LAST_MODIFIED_PATTERN.fullmatch(value)
+    if match is None:
+        raise ValueError(f"Invalid timestamp: {value!r}")
+    hour = int(match["hour"]) % 12 + (12 if match["am_pm"].lower() == "pm" else 0)
+    return datetime.datetime(
+        int(match["year"]),
+        int(match["month"]),
+        int(match["day"]),
+        hour,
+        int(match["minute"]),
+        tzinfo=PACIFIC,
+    )
+
+
+# The address formats we've seen, tried in order. Parts never contain commas;
+# state and zip code are single words.
+ADDRESS_PATTERNS = [
+    # "street, city, ST zip"
+    re.compile(
+        r"(?P<street>[^,]*),(?P<city>[^,]*),\s*(?P<state>[^ ,]+) +(?P<zip>[^ ,]+)\s*"
+    ),
+    # "street city, ST zip" (we have to guess that the city is one word)
+    re.compile(
+        r"\s*(?:(?P<street>[^,]*?) +)?(?P<city>[^ ,]+)\s*,\s*(?P<state>[^ ,]+) +(?P<zip>[^ ,]+)\s*"
+    ),
+    # "street, city ST zip"
+    re.compile(
+        r"(?P<street>[^,]*),\s*(?P<city>[^ ,]+) +(?P<state>[^ ,]+) +(?P<zip>[^ ,]+)\s*"
+    ),
+    # "street city ST zip" (again guessing at a one-word city)
+    re.compile(
+        r"(?:(?P<street>[^,]*?) +)?(?P<city>[^ ,]+) +(?P<state>[^ ,]+) +(?P<zip>[^ ,]+)"
+    ),
+]
+
+
+def split_address(address: str) -> tuple[str, str, str, str]:
+    """
+    Split a one-line address into street, city, state, and zip code.
+
+    Surrounding whitespace is ignored, as it is stripped from the CSV values.
+    """
+    address = address.strip()
+    for pattern in ADDRESS_PATTERNS:
+        match = pattern.fullmatch(address)
+        if match is not None:
+            street, city, state, zip_code = match.group(
+                "street", "city", "state", "zip"
+            )
+            return (street or "").strip(), city.strip(), state, zip_code
+    raise AssertionError(f"Unexpected address format: {address}")
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_occurred_at(yyyy: str, mm: str, dd: str) -> PartialDate:
+    """
+    Build an incident's PartialDate from its Year, Month, and Day columns.
+
+    Many incidents share a date, and PartialDate is immutable, so results are
+    cached and each distinct date is only parsed and validated once.
+    """
+    if dd == "null":
+        dd = ""
+    assert len(yyyy) == 4, f"Year: {yyyy}"
+    assert not mm or len(mm) == 2, f"Month: {mm}"
+    assert not dd or 1 <= len(dd) <= 2, f"Day: {dd}"
+    return PartialDate(
+        year=int(yyyy),
+        month=int(mm) if mm else None,
+        day=int(dd) if dd else None,
+    )
+
+
+# An AirTable attachment, "name (url)". The URL starts at the first "(http",
+# so parentheses in the name, or in the URL (which embeds the name), are fine.
+ATTACHMENT_PATTERN = re.compile(r"(?P<name>.*?)\s*\((?P<url>https?://.*)\)")
+
+
+def split_attachment(value: str) -> tuple[str, str]:
+    """Split an AirTable attachment, "name (url)", into its name and URL."""
+    match = ATTACHMENT_PATTERN.fullmatch(value)
+    assert match is not None, f"Unexpected attachment format: {value}"
+    return match["name"].strip(), match["url"].strip()
+
 
 class Command(BaseCommand):
     """
@@ -38,22 +154,115 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument("path", type=str)
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Number of rows per INSERT statement (default: 200)",
+        )
+        parser.add_argument(
+            "--drop-indexes",
+            action="store_true",
+            help=(
+                "Drop secondary indexes on the loaded tables while importing, "
+                "and rebuild them at the end (PostgreSQL only)"
+            ),
+        )
+        parser.add_argument(
+            "--use-copy",
+            action="store_true",
+            help="Insert rows with COPY rather than INSERT (PostgreSQL only)",
+        )
 
     def handle(self, *args, **options):
         # Get the path to the exports directory
         data_dir = pathlib.Path(options["path"]).resolve()
-
-        # Load the districts
-        districts_path = data_dir / "districts.csv"
-        self.load_districts(districts_path)
-
-        # Load the schools
-        schools_path = data_dir / "schools.csv"
-        self.load_schools(schools_path)
-
-        # Load the incidents
-        incidents_path = data_dir / "incidents.csv"
-        self.load_incidents(incidents_path)
+        self.batch_size = options["batch_size"]
+        if self.batch_size < 1:
+            raise CommandError("--batch-size must be a positive integer")
+        # Per-row messages are only written with --verbosity 2 or higher
+        self.verbosity = options["verbosity"]
+        if options["drop_indexes"] and connection.vendor != "postgresql":
+            raise CommandError("--drop-indexes requires PostgreSQL")
+        self.use_copy = options["use_copy"]
+        if self.use_copy and connection.vendor != "postgresql":
+            raise CommandError("--use-copy requires PostgreSQL")
+
+        # Downloaded attachments are cached next to the exports, so that
+        # re-running the import doesn't fetch everything all over again.
+        self.cache_dir = data_dir / ".cache" / "attachments"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # A single client, so that downloads reuse pooled connections
+        self.http = httpx.Client(
+            timeout=30, limits=httpx.Limits(max_keepalive_connections=16)
+        )
+        indexes = (
+            self.without_indexes()
+            if options["drop_indexes"]
+            else contextlib.nullcontext()
+        )
+        # The whole import is a single transaction: it commits once at the end,
+        # and a failure partway through leaves the database untouched (and,
+        # with --drop-indexes, still indexed).
+        with self.http, transaction.atomic(), indexes:
+            # Load the districts
+            districts_path = data_dir / "districts.csv"
+            self.load_districts(districts_path)
+
+            # Load the schools
+            schools_path = data_dir / "schools.csv"
+            self.load_schools(schools_path)
+
+            # Load the incidents
+            incidents_path = data_dir / "incidents.csv"
+            self.load_incidents(incidents_path)
+
+    # Tables written by the loaders
+    LOADED_MODELS = (
+        SchoolDistrict,
+        DistrictLogo,
+        School,
+        Incident,
+        Incident.incident_types.through,
+        Incident.source_types.through,
+        IncidentExtra,
+        SupportingMaterial,
+    )
+
+    @contextlib.contextmanager
+    def without_indexes(self):
+        """
+        Drop non-unique secondary indexes on the loaded tables, and recreate
+        them on exit, so the bulk inserts don't have to maintain them.
+
+        Primary keys and unique indexes are kept, since they enforce
+        constraints. This must run inside a transaction: if the import fails,
+        rolling back restores the dropped indexes.
+        """
+        tables = [model._meta.db_table for model in self.LOADED_MODELS]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT i.relname, pg_get_indexdef(i.oid) "
+                "FROM pg_index x "
+                "JOIN pg_class i ON i.oid = x.indexrelid "
+                "JOIN pg_class t ON t.oid = x.indrelid "
+                "WHERE t.relname = ANY(%s) AND pg_table_is_visible(t.oid) "
+                "AND NOT x.indisprimary AND NOT x.indisunique",
+                [tables],
+            )
+            indexes = cursor.fetchall()
+            for name, _ in indexes:
+                cursor.execute(f"DROP INDEX {connection.ops.quote_name(name)}")
+        self.stdout.write(f"Dropped {len(indexes)} indexes")
+        yield
+        with connection.cursor() as cursor:
+            # Run the deferred foreign key checks now; PostgreSQL won't build
+            # an index on a table with pending trigger events.
+            cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+            for _, definition in indexes:
+                cursor.execute(definition)
+        self.stdout.write(f"Rebuilt {len(indexes)} indexes")
 
     def seattle(self) -> Region:
         """Get or create the Seattle region."""
@@ -66,36 +275,165 @@ class Command(BaseCommand):
         assert user.is_superuser
         return user
 
+    def fetch(self, url: str) -> pathlib.Path:
+        """Download a URL into the cache, if needed, and return its path."""
+        cache_path = self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.bin"
+        if cache_path.exists():
+            return cache_path
+        # Stream the body to disk rather than holding it in memory, and write
+        # to a temporary file first, so an interrupted run never leaves a
+        # truncated entry behind.
+        partial_path = cache_path.with_suffix(f".{threading.get_ident()}.partial")
+        with self.http.stream("GET", url) as response:
+            response.raise_for_status()
+            with open(partial_path, "wb") as file:
+                file.writelines(response.iter_bytes(1 << 16))
+        partial_path.replace(cache_path)
+        return cache_path
+
+    def fetch_all(self, urls: list[str]) -> list[pathlib.Path]:
+        """Download the contents of several URLs concurrently, in order."""
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            return list(executor.map(self.fetch, urls))
+
+    def bulk_insert(self, model: type[models.Model], objs: list[models.Model]):
+        """Insert new model instances with bulk_create(), or with --use-copy, COPY."""
+        if not self.use_copy:
+            model._default_manager.bulk_create(objs, batch_size=self.batch_size)
+            return
+        if not objs:
+            return
+        opts = model._meta
+        quote_name = connection.ops.quote_name
+        fields = [field for field in opts.concrete_fields if not field.generated]
+        column_names = []
+        for field in fields:
+            # Only concrete fields are copied, and every one has a column
+            assert field.column is not None
+            column_names.append(quote_name(field.column))
+        with connection.cursor() as cursor:
+            # COPY can't hand back generated keys, so reserve them up front;
+            # later rows (M2Ms, attachments) need to refer to these ones.
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, %s)) "
+                "FROM generate_series(1, %s)",
+                [opts.db_table, opts.pk.column, len(objs)],
+            )
+            for obj, (pk,) in zip(objs, cursor.fetchall()):
+                obj.pk = pk
+            columns = ", ".join(column_names)
+            with cursor.copy(
+                f"COPY {quote_name(opts.db_table)} ({columns}) FROM STDIN"
+            ) as copy:
+                for obj in objs:
+                    copy.write_row([self.copy_value(obj, field) for field in fields])
+        for obj in objs:
+            obj._state.adding = False
+            obj._state.db = connection.alias
+
+    def copy_value(self, obj: models.Model, field: models.Field) -> t.Any:
+        """Get a field's database value for COPY, as an INSERT would write it."""
+        if isinstance(field, models.ForeignKey) and field.is_cached(obj):
+            # Related objects may have been saved (and given a pk) after
+            # they were assigned to this one
+            related = field.get_cached_value(obj)
+            return None if related is None else related.pk
+        return field.get_db_prep_save(field.pre_save(obj, add=True), connection)
+
+    def get_or_create_types(
+        self, model: type[_TypeModel], names: list[str]
+    ) -> dict[str, _TypeModel]:
+        """Get or create incident or source types by name, with a few queries."""
+        names = list(dict.fromkeys(names))
+        existing = set(
+            model.objects.filter(name__in=names).values_list("name", flat=True)
+        )
+        model.objects.bulk_create(
+            [model(name=name) for name in names if name not in existing],
+            batch_size=self.batch_size,
+        )
+        return {obj.name: obj for obj in model.objects.filter(name__in=names)}
+
     def load_districts(self, path: pathlib.Path):
         """Load districts from a CSV file."""
         self.stdout.write(f"Loading districts from {path}")
-        with open(path, encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file)
+        # Rows are saved every --batch-size rows, so only one batch of model
+        # instances (and logos) is held in memory at a time.
+        districts: list[SchoolDistrict] = []
+        logos: list[DistrictLogo] = []
+        logo_urls: list[str] = []
+        created = 0
+
+        def flush():
+            nonlocal created
+            # Download the batch's logos at once, rather than one at a time
+            for logo, logo_path in zip(logos, self.fetch_all(logo_urls)):
+                logo.set_data(logo_path.read_bytes())
+
+            # Insert everything in a handful of multi-row INSERTs, rather
+            # than one INSERT per row.
+            self.bulk_insert(SchoolDistrict, districts)
+            self.bulk_insert(DistrictLogo, logos)
+
+            if self.verbosity >= 2:
+                for district in districts:
+                    self.stdout.write(f"Created district: {district}")
+            created += len(districts)
+            districts.clear()
+            logos.clear()
+            logo_urls.clear()
+
+        # Names already in the database, or queued for insertion in this run
+        names = set(SchoolDistrict.objects.values_list("name", flat=True))
+        with open(path, encoding="utf-8-sig", buffering=1 << 20) as file:
+            # Plain rows and column indices resolved once from the header are
+            # cheaper than building a dict for every row.
+            reader = csv.reader(file)
+            header = next(reader)
+            district_name_col = header.index("District-Name")
+            district_url_col = header.index("District-URL")
+            district_twitter_col = header.index("District-Twitter")
+            district_facebook_col = header.index("District-Facebook")
+            district_phone_col = header.index("District-Phone")
+            superintendent_name_col = header.index("Superintendent-Name")
+            superintendent_email_col = header.index("Superintendent-Email")
+            civilrights_url_col = header.index("CivilRights-URL")
+            civilrights_contact_col = header.index("CivilRights-Contact")
+            civilrights_email_col = header.index("CivilRights-Email")
+            hib_url_col = header.index("HIB-URL")
+            hib_form_col = header.index("HIB-Form")
+            hib_contact_col = header.index("HIB-Contact")
+            hib_email_col = header.index("HIB-Email")
+            board_url_col = header.index("Board-URL")
+            district_logo_col = header.index("District-Logo")
             for row in reader:
-                name = row["District-Name"].strip()
-                existing_district = SchoolDistrict.objects.filter(name=name).first()
-                if existing_district:
-                    self.stdout.write(f"District already exists: {existing_district}")
+                if not row:
+                    continue
+                name = row[district_name_col].strip()
+                if name in names:
+                    if self.verbosity >= 2:
+                        self.stdout.write(f"District already exists: {name}")
                     continue
+                names.add(name)
                 assert name
-                url = row["District-URL"].strip()
+                url = row[district_url_col].strip()
                 assert url
-                twitter = row["District-Twitter"].strip() or ""
-                facebook = row["District-Facebook"].strip() or ""
-                phone = row["District-Phone"].strip() or ""
-                superintendent_name = row["Superintendent-Name"].strip()
+                twitter = row[district_twitter_col].strip() or ""
+                facebook = row[district_facebook_col].strip() or ""
+                phone = row[district_phone_col].strip() or ""
+                superintendent_name = row[superintendent_name_col].strip()
                 # assert superintendent_name
-                superintendent_email = row["Superintendent-Email"].strip()
-                civil_rights_url = row["CivilRights-URL"].strip() or ""
-                civil_rights_contact_name = row["CivilRights-Contact"].strip() or ""
-                civil_rights_contact_email = row["CivilRights-Email"].strip() or ""
-                hib_url = row["HIB-URL"].strip() or ""
-                hib_form_url = row["HIB-Form"].strip() or ""
-                hib_contact_name = row["HIB-Contact"].strip() or ""
-                hib_contact_email = row["HIB-Email"].strip() or ""
-                board_url = row["Board-URL"].strip() or ""
-
-                district = SchoolDistrict.objects.create(
+                superintendent_email = row[superintendent_email_col].strip()
+                civil_rights_url = row[civilrights_url_col].strip() or ""
+                civil_rights_contact_name = row[civilrights_contact_col].strip() or ""
+                civil_rights_contact_email = row[civilrights_email_col].strip() or ""
+                hib_url = row[hib_url_col].strip() or ""
+                hib_form_url = row[hib_form_col].strip() or ""
+                hib_contact_name = row[hib_contact_col].strip() or ""
+                hib_contact_email = row[hib_email_col].strip() or ""
+                board_url = row[board_url_col].strip() or ""
+
+                district = SchoolDistrict(
                     name=name,
                     url=url,
                     twitter=twitter,
@@ -113,115 +451,97 @@ class Command(BaseCommand):
                     board_url=board_url,
                 )
 
-                logo_parts_str = row["District-Logo"].strip()
-                logo_name, logo_url = logo_parts_str.split("(")
-                logo_name = logo_name.strip()
-                logo_url = logo_url.strip(")").strip()
-                logo_data_response = httpx.get(logo_url)
-                logo_data_response.raise_for_status()
-                _ = DistrictLogo.objects.create(
-                    district=district, name=logo_name, data=logo_data_response.content
-                )
+                logo_parts_str = row[district_logo_col].strip()
+                logo_name, logo_url = split_attachment(logo_parts_str)
+                districts.append(district)
+                logos.append(DistrictLogo(district=district, name=logo_name))
+                logo_urls.append(logo_url)
+                if len(districts) >= self.batch_size:
+                    flush()
+        flush()
 
-                self.stdout.write(f"Created district: {district}")
+        self.stdout.write(f"Created {created} districts")
 
     def load_schools(self, path: pathlib.Path):
         """Load schools from a CSV file."""
         self.stdout.write(f"Loading schools from {path}")
-        with open(path, encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file)
+        # Resolve districts against an in-memory map rather than a query per row;
+        # schools only need the district's key.
+        districts_by_name = {
+            district.name: district
+            for district in SchoolDistrict.objects.only("id", "name")
+        }
+        # Rows are saved every --batch-size rows, so only one batch of model
+        # instances is held in memory at a time.
+        schools: list[School] = []
+        created = 0
+
+        def flush():
+            nonlocal created
+            self.bulk_insert(School, schools)
+            if self.verbosity >= 2:
+                for school in schools:
+                    self.stdout.write(f"Created school: {school}")
+            created += len(schools)
+            schools.clear()
+
+        # Names already in the database, or queued for insertion in this run
+        names = set(School.objects.values_list("name", flat=True))
+        with open(path, encoding="utf-8-sig", buffering=1 << 20) as file:
+            # Plain rows and column indices resolved once from the header are
+            # cheaper than building a dict for every row.
+            reader = csv.reader(file)
+            header = next(reader)
+            name_col = header.index("Name")
+            website_col = header.index("Website")
+            school_type_col = header.index("School-Type")
+            district_col = header.index("District")
+            school_level_col = header.index("School-Level")
+            address_col = header.index("Address")
+            latitude_col = header.index("Latitude")
+            longitude_col = header.index("Longitude")
             for row in reader:
-                name = row["Name"].strip()
+                if not row:
+                    continue
+                name = row[name_col].strip()
                 assert name
-                existing_school = School.objects.filter(name=name).first()
-                if existing_school:
-                    self.stdout.write(f"School already exists: {existing_school}")
+                if name in names:
+                    if self.verbosity >= 2:
+                        self.stdout.write(f"School already exists: {name}")
                     continue
-                url = row["Website"].strip()
+                names.add(name)
+                url = row[website_col].strip()
                 # assert url
-                school_type = row["School-Type"].strip().lower()
+                school_type = row[school_type_col].strip().lower()
                 assert school_type in ["public", "private", ""]
                 is_public = school_type == "public"
-                school_district = row["District"].strip()
+                school_district = row[district_col].strip()
                 district = (
-                    SchoolDistrict.objects.get(name=school_district)
-                    if school_district
-                    else None
+                    districts_by_name[school_district] if school_district else None
                 )
-                school_levels = [
-                    sl.strip().lower() for sl in row["School-Level"].split(",")
-                ]
-                is_elementary = False
-                is_middle = False
-                is_high = False
-                for school_level in school_levels:
-                    if school_level == "elementary":
-                        is_elementary = True
-                    elif school_level == "middle":
-                        is_middle = True
-                    elif school_level == "high":
-                        is_high = True
-                address = row["Address"].strip()
+                school_levels = {
+                    sl.strip().lower() for sl in row[school_level_col].split(",")
+                }
+                is_elementary = "elementary" in school_levels
+                is_middle = "middle" in school_levels
+                is_high = "high" in school_levels
+                address = row[address_col].strip()
                 street = ""
                 city = ""
                 state = ""
                 zip_code = ""
                 if address:
-                    address = address.replace("\n", " ")
-                    comma_count = address.count(",")
-                    # print(f"Address: {address}")
-                    if comma_count == 2:
-                        # How many parts to the state?
-                        parts = address.split(",")
-                        assert len(parts) == 3
-                        street, city, state_zip = parts
-                        street = street.strip()
-                        city = city.strip()
-                        state, zip_code = state_zip.strip().split(" ")
-                        state = state.strip()
-                        zip_code = zip_code.strip()
-                    elif comma_count == 1:
-                        # How many parts to the state?
-                        parts = address.split(",")
-                        try:
-                            street_city, state_zip = parts
-                            street_city = street_city.strip()
-                            state, zip_code = state_zip.strip().split(" ")
-                            state = state.strip()
-                            zip_code = zip_code.strip()
-                            street_city_parts = street_city.split(" ")
-                            city = street_city_parts[-1]
-                            street = " ".join(street_city_parts[:-1])
-                            city = city.strip()
-                            street = street.strip()
-                        except Exception:
-                            street, city_state_zip = parts
-                            city_state_zip = city_state_zip.strip()
-                            city, state, zip_code = city_state_zip.split(" ")
-                            city = city.strip()
-                            state = state.strip()
-                            zip_code = zip_code.strip()
-                            street = street.strip()
-                    elif comma_count == 0:
-                        parts = address.split(" ")
-                        zip_code = parts[-1]
-                        state = parts[-2]
-                        city = parts[-3]  # What else can we do?
-                        street = " ".join(parts[:-3])
-                        zip_code = zip_code.strip()
-                        state = state.strip()
-                        city = city.strip()
-                        street = street.strip()
-                    else:
-                        assert False, f"Unexpected address format: {address}"
-
-                latitude_str = row["Latitude"].strip()
-                longitude_str = row["Longitude"].strip()
+                    street, city, state, zip_code = split_address(
+                        address.replace("\n", " ")
+                    )
+
+                latitude_str = row[latitude_col].strip()
+                longitude_str = row[longitude_col].strip()
 
                 latitude = float(latitude_str) if latitude_str else None
                 longitude = float(longitude_str) if longitude_str else None
 
-                school = School.objects.create(
+                school = School(
                     name=name,
                     url=url,
                     district=district,
@@ -236,8 +556,12 @@ class Command(BaseCommand):
                     is_middle=is_middle,
                     is_high=is_high,
                 )
+                schools.append(school)
+                if len(schools) >= self.batch_size:
+                    flush()
+        flush()
 
-                self.stdout.write(f"Created school: {school}")
+        self.stdout.write(f"Created {created} schools")
 
     def load_incidents(self, path: pathlib.Path):
         """Load incidents from a CSV file."""
@@ -247,55 +571,128 @@ class Command(BaseCommand):
         # NOTE: so far, all incidents are published by the default user
         publisher = self.publisher()
 
-        with open(path, encoding="utf-8-sig") as file:
-            reader = csv.DictReader(file)
+        # Resolve schools against an in-memory map rather than a query per row
+        # (incidents only need the school's key)
+        schools_by_name = {
+            school.name: school for school in School.objects.only("id", "name")
+        }
+
+        # Rows are saved every --batch-size incidents, so only one batch of
+        # model instances (and attachments) is held in memory at a time.
+        incidents: list[Incident] = []
+        # Type names are resolved to types as each batch is saved; these
+        # lists run parallel to `incidents`.
+        incident_type_names_by_incident: list[list[str]] = []
+        source_type_names_by_incident: list[list[str]] = []
+        extras: list[IncidentExtra] = []
+        supporting_materials: list[SupportingMaterial] = []
+        supporting_material_urls: list[str] = []
+        created = 0
+        created_supporting_materials = 0
+
+        def flush():
+            nonlocal created, created_supporting_materials
+            # Download the batch's supporting materials at once
+            for supporting_material, supporting_material_path in zip(
+                supporting_materials, self.fetch_all(supporting_material_urls)
+            ):
+                supporting_material.set_data(supporting_material_path.read_bytes())
+
+            self.bulk_insert(Incident, incidents)
+
+            incident_types_by_name = self.get_or_create_types(
+                IncidentType,
+                [name for names in incident_type_names_by_incident for name in names],
+            )
+            source_types_by_name = self.get_or_create_types(
+                SourceType,
+                [name for names in source_type_names_by_incident for name in names],
+            )
+
+            # Insert the M2M rows directly, rather than calling .set() (a
+            # SELECT and an INSERT per relation) for every incident.
+            IncidentTypeThrough = Incident.incident_types.through
+            SourceTypeThrough = Incident.source_types.through
+            incident_type_rows = [
+                IncidentTypeThrough(
+                    incident=incident, incidenttype=incident_types_by_name[name]
+                )
+                for incident, names in zip(incidents, incident_type_names_by_incident)
+                for name in dict.fromkeys(names)
+            ]
+            source_type_rows = [
+                SourceTypeThrough(
+                    incident=incident, sourcetype=source_types_by_name[name]
+                )
+                for incident, names in zip(incidents, source_type_names_by_incident)
+                for name in dict.fromkeys(names)
+            ]
+            self.bulk_insert(IncidentTypeThrough, incident_type_rows)
+            self.bulk_insert(SourceTypeThrough, source_type_rows)
+            # Bulk inserts don't send m2m_changed, so fill in the
+            # denormalized type names ourselves.
+            Incident.objects.refresh_type_caches(incident.pk for incident in incidents)
+
+            self.bulk_insert(IncidentExtra, extras)
+            self.bulk_insert(SupportingMaterial, supporting_materials)
+
+            if self.verbosity >= 2:
+                for incident in incidents:
+                    self.stdout.write(f"Created incident: {incident}")
+            created += len(incidents)
+            created_supporting_materials += len(supporting_materials)
+            for batch in (
+                incidents,
+                incident_type_names_by_incident,
+                source_type_names_by_incident,
+                extras,
+                supporting_materials,
+                supporting_material_urls,
+            ):
+                batch.clear()
+
+        with open(path, encoding="utf-8-sig", buffering=1 << 20) as file:
+            # Plain rows and column indices resolved once from the header are
+            # cheaper than building a dict for every row.
+            reader = csv.reader(file)
+            header = next(reader)
+            year_col = header.index("Year")
+            month_col = header.index("Month")
+            day_col = header.index("Day")
+            school_col = header.index("School")
+            incident_type_col = header.index("Incident-Type")
+            incident_description_col = header.index("Incident-Description")
+            school_response_col = header.index("School-Response")
+            reported_school_col = header.index("Reported-School")
+            sources_col = header.index("Source(s)")
+            last_modified_col = header.index("Last Modified")
+            media_coverage_col = header.index("Media-Coverage")
+            social_media_post_col = header.index("Social-Media-Post")
+            other_related_col = header.index("Other-Related")
+            supporting_materials_col = header.index("Supporting-Materials")
             for row in reader:
-                yyyy = row["Year"].strip()
-                assert len(yyyy) == 4, f"Year: {yyyy}"
-                mm = row["Month"].strip() or None
-                assert mm is None or len(mm) == 2, f"Month: {mm}"
-                dd = row["Day"].strip() or None
-                if dd == "null":
-                    dd = None
-                assert dd is None or 1 <= len(dd) <= 2, f"Day: {dd}"
-                occurred_at = PartialDate(
-                    year=int(yyyy),
-                    month=int(mm) if mm else None,
-                    day=int(dd) if dd else None,
+                if not row:
+                    continue
+                occurred_at = parse_occurred_at(
+                    row[year_col].strip(), row[month_col].strip(), row[day_col].strip()
                 )
-                school_name = row["School"].strip()
-                school = School.objects.get(name=school_name)
+                school_name = row[school_col].strip()
+                school = schools_by_name[school_name]
                 incident_type_list = [
-                    it.strip() for it in row["Incident-Type"].split(",")
+                    it.strip() for it in row[incident_type_col].split(",")
                 ]
-                incident_types: list[IncidentType] = []
-                for incident_type_name in incident_type_list:
-                    incident_type, _ = IncidentType.objects.get_or_create(
-                        name=incident_type_name
-                    )
-                    incident_types.append(incident_type)
-                description = row["Incident-Description"].strip()
+                description = row[incident_description_col].strip()
 
-                school_response = row["School-Response"].strip()
+                school_response = row[school_response_col].strip()
 
-                reported_school_str = row["Reported-School"].strip()
+                reported_school_str = row[reported_school_col].strip()
                 reported_to_school = reported_school_str == "Yes"
-                source_list = [s.strip() for s in row["Source(s)"].split(",")]
-                source_types: list[SourceType] = []
-                for source_name in source_list:
-                    source_type, _ = SourceType.objects.get_or_create(name=source_name)
-                    source_types.append(source_type)
-
-                last_modified_str = row["Last Modified"].strip()
-                # Parse date in format "M/DD/YYYY HH:MMam/pm"
-                last_modified = datetime.datetime.strptime(
-                    last_modified_str, "%m/%d/%Y %I:%M%p"
-                )
-                # Put it in the America/Los_Angeles timezone
-                PACIFIC = zoneinfo.ZoneInfo("America/Los_Angeles")
-                last_modified = last_modified.replace(tzinfo=PACIFIC)
+                source_list = [s.strip() for s in row[sources_col].split(",")]
 
-                incident = Incident.objects.create(
+                last_modified_str = row[last_modified_col].strip()
+                last_modified = parse_last_modified(last_modified_str)
+
+                incident = Incident(
                     region=region,
                     occurred_at=occurred_at,
                     school=school,
@@ -306,53 +703,64 @@ class Command(BaseCommand):
                     published_by=publisher,
                     school_response=school_response,
                 )
-                incident.incident_types.set(incident_types)
-                incident.source_types.set(source_types)
+                incidents.append(incident)
+                incident_type_names_by_incident.append(incident_type_list)
+                source_type_names_by_incident.append(source_list)
 
-                media_coverage = row["Media-Coverage"].strip()
+                media_coverage = row[media_coverage_col].strip()
                 if media_coverage:
-                    _ = IncidentExtra.objects.create(
-                        incident=incident, name="media-coverage", value=media_coverage
+                    extras.append(
+                        IncidentExtra(
+                            incident=incident,
+                            name="media-coverage",
+                            value=media_coverage,
+                        )
                     )
 
-                social_media_post = row["Social-Media-Post"].strip()
+                social_media_post = row[social_media_post_col].strip()
                 if social_media_post:
-                    _ = IncidentExtra.objects.create(
-                        incident=incident,
-                        name="social-media-post",
-                        value=social_media_post,
+                    extras.append(
+                        IncidentExtra(
+                            incident=incident,
+                            name="social-media-post",
+                            value=social_media_post,
+                        )
                     )
 
-                other_related = row["Other-Related"].strip()
+                other_related = row[other_related_col].strip()
                 if other_related:
-                    _ = IncidentExtra.objects.create(
-                        incident=incident, name="other-related", value=other_related
+                    extras.append(
+                        IncidentExtra(
+                            incident=incident,
+                            name="other-related",
+                            value=other_related,
+                        )
                     )
 
-                supporting_materials_str = row["Supporting-Materials"].strip()
+                supporting_materials_str = row[supporting_materials_col].strip()
                 if supporting_materials_str:
                     supporting_materials_parts = [
                         sm.strip() for sm in supporting_materials_str.split(",")
                     ]
                     for supporting_material in supporting_materials_parts:
                         supporting_material_name, supporting_material_url = (
-                            supporting_material.split("(")
-                        )
-                        supporting_material_name = supporting_material_name.strip()
-                        supporting_material_url = supporting_material_url.strip(
-                            ")"
-                        ).strip()
-                        self.stdout.write(
-                            f"Created supporting material: {supporting_material_name} ({supporting_material_url})"
+                            split_attachment(supporting_material)
                         )
-                        supporting_material_response = httpx.get(
-                            supporting_material_url
+                        if self.verbosity >= 2:
+                            self.stdout.write(
+                                f"Created supporting material: {supporting_material_name} ({supporting_material_url})"
+                            )
+                        supporting_materials.append(
+                            SupportingMaterial(
+                                incident=incident, name=supporting_material_name
+                            )
                         )
-                        supporting_material_response.raise_for_status()
-                        _ = SupportingMaterial.objects.create(
-                            incident=incident,
-                            name=supporting_material_name,
-                            data=supporting_material_response.content,
-                        )
-
-                self.stdout.write(f"Created incident: {incident}")
+                        supporting_material_urls.append(supporting_material_url)
+                if len(incidents) >= self.batch_size:
+                    flush()
+        flush()
+
+        self.stdout.write(
+            f"Created {created} incidents"
+            f" with {created_supporting_materials} supporting materials"
+        )
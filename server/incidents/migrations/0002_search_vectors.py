@@ -0,0 +1,74 @@
+# Generated by Django 5.1 on 2026-10-14 18:03
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# (table, text search configuration, source columns) for each search vector.
+# The trigger, backfill, and GIN index are PostgreSQL-only; on other databases
+# the columns simply stay NULL and admin search falls back to ILIKE.
+SEARCH_VECTORS = [
+    (
+        "incidents_schooldistrict",
+        "simple",
+        [
+            "superintendent_name",
+            "civil_rights_contact_name",
+            "hib_contact_name",
+        ],
+    ),
+    ("incidents_incident", "english", ["description"]),
+]
+
+
+def create_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, config, columns in SEARCH_VECTORS:
+        schema_editor.execute(
+            f"CREATE TRIGGER {table}_search_update "
+            f"BEFORE INSERT OR UPDATE ON {table} FOR EACH ROW "
+            f"EXECUTE FUNCTION tsvector_update_trigger("
+            f"search, 'pg_catalog.{config}', {', '.join(columns)})"
+        )
+        document = " || ' ' || ".join(f"coalesce({column}, '')" for column in columns)
+        schema_editor.execute(
+            f"UPDATE {table} SET search = "
+            f"to_tsvector('pg_catalog.{config}', {document})"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX {table}_search_gin ON {table} USING gin (search)"
+        )
+
+
+def drop_search_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, _, _ in SEARCH_VECTORS:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_search_gin")
+        schema_editor.execute(
+            f"DROP TRIGGER IF EXISTS {table}_search_update ON {table}"
+        )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="incident",
+            name="search",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="schooldistrict",
+            name="search",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(create_search_triggers, drop_search_triggers),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1 on 2026-10-14 18:06
+
+from django.db import migrations, models
+
+
+def populate_type_caches(apps, schema_editor):
+    Incident = apps.get_model("incidents", "Incident")
+    incidents = Incident.objects.prefetch_related("incident_types", "source_types")
+    for incident in incidents:
+        incident.incident_types_cache = ", ".join(
+            sorted(t.name for t in incident.incident_types.all())
+        )
+        incident.source_types_cache = ", ".join(
+            sorted(t.name for t in incident.source_types.all())
+        )
+    Incident.objects.bulk_update(
+        incidents, ["incident_types_cache", "source_types_cache"], batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0002_search_vectors"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="incident",
+            name="incident_types_cache",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Comma-separated incident type names",
+                verbose_name="incident types",
+            ),
+        ),
+        migrations.AddField(
+            model_name="incident",
+            name="source_types_cache",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Comma-separated source type names",
+                verbose_name="source types",
+            ),
+        ),
+        migrations.RunPython(populate_type_caches, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.1 on 2026-10-14 18:09
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# (table, column) pairs searched with icontains from the admin. On PostgreSQL,
+# icontains compiles to UPPER(column::text) LIKE UPPER(...), so the trigram
+# indexes are built over that same expression for the planner to use them.
+TRIGRAM_INDEXES = [
+    ("incidents_school", "name"),
+    ("incidents_school", "city"),
+    ("incidents_schooldistrict", "name"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX {table}_{column}_trgm ON {table} "
+            f"USING gin ((UPPER({column}::text)) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {table}_{column}_trgm")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0003_incident_type_caches"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
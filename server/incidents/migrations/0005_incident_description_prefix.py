@@ -0,0 +1,24 @@
+# Generated by Django 5.1 on 2026-10-14 18:11
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0004_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="incident",
+            name="description_prefix",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=django.db.models.functions.text.Substr(
+                    "description", 1, 333
+                ),
+                output_field=models.CharField(max_length=333),
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1 on 2026-10-14 18:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0005_incident_description_prefix"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="school",
+            name="name",
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="schooldistrict",
+            name="name",
+            field=models.CharField(db_index=True, max_length=100),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.1 on 2026-10-14 18:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0006_name_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="incident",
+            index=models.Index(
+                condition=models.Q(("published_at__isnull", False)),
+                fields=["region", "-published_at"],
+                name="incident_published_idx",
+            ),
+        ),
+    ]
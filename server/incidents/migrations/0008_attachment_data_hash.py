@@ -0,0 +1,63 @@
+# Generated by Django 5.1 on 2026-10-14 18:59
+
+import hashlib
+
+from django.db import migrations, models
+
+ATTACHMENT_MODELS = ["districtlogo", "schoolresponsematerial", "supportingmaterial"]
+
+
+def hash_attachment_data(apps, schema_editor):
+    # On PostgreSQL, md5() hashes the blobs in place; elsewhere they're read
+    # back one at a time.
+    for model_name in ATTACHMENT_MODELS:
+        model = apps.get_model("incidents", model_name)
+        if schema_editor.connection.vendor == "postgresql":
+            table = schema_editor.quote_name(model._meta.db_table)
+            schema_editor.execute(f"UPDATE {table} SET data_hash = md5(data)")
+            continue
+        rows = model._default_manager.values_list("pk", "data")
+        for pk, data in rows.iterator(chunk_size=100):
+            model._default_manager.filter(pk=pk).update(
+                data_hash=hashlib.md5(data, usedforsecurity=False).hexdigest()
+            )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("incidents", "0007_incident_published_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="districtlogo",
+            name="data_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="MD5 of the data, in hex; empty if not yet computed",
+                max_length=32,
+            ),
+        ),
+        migrations.AddField(
+            model_name="schoolresponsematerial",
+            name="data_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="MD5 of the data, in hex; empty if not yet computed",
+                max_length=32,
+            ),
+        ),
+        migrations.AddField(
+            model_name="supportingmaterial",
+            name="data_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="MD5 of the data, in hex; empty if not yet computed",
+                max_length=32,
+            ),
+        ),
+        migrations.RunPython(hash_attachment_data, migrations.RunPython.noop),
+    ]
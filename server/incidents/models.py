@@ -1,9 +1,14 @@
+import functools
+import hashlib
+import typing as t
 from mimetypes import guess_type
 
 from django.conf import settings
 from django.contrib.auth.models import Group
+from django.contrib.postgres.search import SearchVectorField
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Substr
 from django.urls import reverse
 from django.utils.text import slugify
 from phonenumber_field.modelfields import PhoneNumberField
@@ -11,6 +16,18 @@ from phonenumber_field.modelfields import PhoneNumberField
 from .fields import PartialDateField
 from .kebab import pascal_to_kebab
 
+
+@functools.lru_cache(maxsize=256)
+def _guess_content_type(name: str) -> str | None:
+    """Guess a file's content type from its name; attachment names repeat a lot."""
+    return guess_type(name)[0]
+
+
+def hash_attachment_data(data: bytes | memoryview) -> str:
+    """Hash an attachment's binary content, as its ETag does."""
+    return hashlib.md5(data, usedforsecurity=False).hexdigest()
+
+
 # -----------------------------------------------------------------------------
 # Abstract base models
 # -----------------------------------------------------------------------------
@@ -22,6 +39,25 @@ from .kebab import pascal_to_kebab
 # approach here.
 
 
+class AttachmentQuerySet(models.QuerySet["AttachmentBase"]):
+    def with_data(self) -> "AttachmentQuerySet":
+        """Also load the attachments' binary content."""
+        return self.defer(None)
+
+
+_AttachmentManagerBase = models.Manager.from_queryset(AttachmentQuerySet)
+
+
+class AttachmentManager(_AttachmentManagerBase["AttachmentBase"]):
+    """Manages a table of attachments; their binary content is loaded on demand."""
+
+    def get_queryset(self) -> AttachmentQuerySet:
+        # Most queries only need an attachment's name (for its URL and content
+        # type); only serving the file itself needs the data.
+        # (from_queryset() creates an AttachmentQuerySet; the stubs can't tell)
+        return t.cast(AttachmentQuerySet, super().get_queryset().defer("data"))
+
+
 class AttachmentBase(models.Model):
     """An arbitrary file attachment."""
 
@@ -34,17 +70,30 @@ class AttachmentBase(models.Model):
         max_length=100, help_text="Includes file extension", db_index=True
     )
     data = models.BinaryField()
+    # Lets a cached copy be revalidated without reading `data`
+    data_hash = models.CharField(
+        max_length=32,
+        blank=True,
+        editable=False,
+        help_text="MD5 of the data, in hex; empty if not yet computed",
+    )
+
+    objects: AttachmentManager = AttachmentManager()
+
+    def set_data(self, data: bytes) -> None:
+        """Set the binary content, along with its hash."""
+        self.data = data
+        self.data_hash = hash_attachment_data(data)
 
     @property
     def content_type(self) -> str | None:
-        return guess_type(self.name)[0]
+        return _guess_content_type(self.name)
 
     @property
     def is_image(self) -> bool:
         content_type = self.content_type
-        if content_type is None:
-            return False
-        return content_type.startswith("image/") or content_type == "image/svg+xml"
+        # NOTE: this includes image/svg+xml
+        return content_type is not None and content_type.startswith("image/")
 
     @property
     def url(self) -> str | None:
@@ -79,9 +128,6 @@ class ExtraBase(models.Model):
 class RegionManager(models.Manager):
     """Manages a table of geographic regions."""
 
-    def _group_name(self, name: str) -> str:
-        return f"{name} Admins"
-
     def create_with_group(self, name: str) -> "Region":
         """Create a region with a group."""
         slug = slugify(name)
@@ -91,6 +137,10 @@ class RegionManager(models.Manager):
     def get_or_create_with_group(self, name: str) -> tuple["Region", bool]:
         """Get or create a region with a group."""
         slug = slugify(name)
+        # Usually the region already exists; don't touch its group at all.
+        region = self.filter(slug=slug).first()
+        if region is not None:
+            return region, False
         group, _ = Group.objects.get_or_create(name=Region.default_group_name(name))
         return self.get_or_create(slug=slug, defaults={"name": name, "group": group})
 
@@ -125,7 +175,7 @@ class Region(models.Model):
 class SchoolDistrict(models.Model):
     """A school district."""
 
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, db_index=True)
 
     logo: "DistrictLogo"
 
@@ -155,6 +205,10 @@ class SchoolDistrict(models.Model):
 
     board_url = models.URLField(blank=True)
 
+    # On PostgreSQL, a trigger keeps this in sync with the contact name
+    # columns, and a GIN index backs admin search over them.
+    search = SearchVectorField(null=True, editable=False)
+
     def __str__(self) -> str:
         return f"{self.name} ({self.pk})"
 
@@ -177,7 +231,7 @@ class DistrictLogo(AttachmentBase):
 class School(models.Model):
     """A school."""
 
-    name = models.CharField(max_length=100)
+    name = models.CharField(max_length=100, db_index=True)
     url = models.URLField()
     district = models.ForeignKey(
         SchoolDistrict,
@@ -261,9 +315,31 @@ class IncidentExtra(ExtraBase):
         verbose_name_plural = "Incident Extras"
 
 
+class IncidentManager(models.Manager["Incident"]):
+    """Manages a table of incidents."""
+
+    def refresh_type_caches(self, pks: t.Iterable[int]) -> None:
+        """Recompute the denormalized type name lists for the given incidents."""
+        incidents = list(
+            self.filter(pk__in=list(pks)).prefetch_related(
+                "incident_types", "source_types"
+            )
+        )
+        for incident in incidents:
+            incident.incident_types_cache = _join_names(incident.incident_types.all())
+            incident.source_types_cache = _join_names(incident.source_types.all())
+        self.bulk_update(incidents, ["incident_types_cache", "source_types_cache"])
+
+
+def _join_names(objs: t.Iterable[IncidentType | SourceType]) -> str:
+    return ", ".join(sorted(obj.name for obj in objs))
+
+
 class Incident(models.Model):
     """An incident."""
 
+    objects: IncidentManager = IncidentManager()
+
     region = models.ForeignKey(
         Region,
         blank=False,
@@ -273,6 +349,13 @@ class Incident(models.Model):
     )
 
     description = models.TextField()
+    # A stored prefix of the description (as much as __str__ shows), so that
+    # list views can show a truncated description without fetching it all.
+    description_prefix = models.GeneratedField(
+        expression=Substr("description", 1, 333),
+        output_field=models.CharField(max_length=333),
+        db_persist=True,
+    )
     notes = models.TextField(
         blank=True, default="", help_text="Administrative notes (never shown publicly)"
     )
@@ -303,6 +386,23 @@ class Incident(models.Model):
     incident_types = models.ManyToManyField(IncidentType)
     source_types = models.ManyToManyField(SourceType)
 
+    # Denormalized copies of the type names above, kept in sync by signal
+    # handlers so that list views don't need to join through the M2Ms.
+    incident_types_cache = models.TextField(
+        "incident types",
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Comma-separated incident type names",
+    )
+    source_types_cache = models.TextField(
+        "source types",
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Comma-separated source type names",
+    )
+
     supporting_materials: models.QuerySet["SupportingMaterial"]
     school_response_materials: models.QuerySet["SchoolResponseMaterial"]
 
@@ -316,8 +416,28 @@ class Incident(models.Model):
     def school_responded(self) -> bool:
         return bool(self.school_response)
 
+    # On PostgreSQL, a trigger keeps this in sync with the description, and
+    # a GIN index backs admin search over it.
+    search = SearchVectorField(null=True, editable=False)
+
     def __str__(self) -> str:
-        return f"Incident ({self.pk}): {self.occurred_at} {self.school.name} {self.description[:333]}..."
+        description = (
+            self.description_prefix
+            if "description" in self.get_deferred_fields()
+            else self.description[:333]
+        )
+        return f"Incident ({self.pk}): {self.occurred_at} {self.school.name} {description}..."
+
+    class Meta:
+        indexes = [
+            # Published incidents, by region and most recent first. Unpublished
+            # reports are left out of the index entirely.
+            models.Index(
+                fields=["region", "-published_at"],
+                name="incident_published_idx",
+                condition=models.Q(published_at__isnull=False),
+            ),
+        ]
 
 
 class SupportingMaterial(AttachmentBase):
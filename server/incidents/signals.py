@@ -0,0 +1,50 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .models import Incident, IncidentType, SourceType
+
+
+@receiver(m2m_changed, sender=Incident.incident_types.through)
+@receiver(m2m_changed, sender=Incident.source_types.through)
+def refresh_incident_type_caches(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep an incident's denormalized type names in sync with its M2Ms."""
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            Incident.objects.refresh_type_caches([instance.pk])
+        return
+    # Changed from the other side: `instance` is an IncidentType or SourceType,
+    # and `pk_set` holds incident pks (except when clearing).
+    if action == "pre_clear":
+        instance._cleared_incident_pks = list(
+            instance.incident_set.values_list("pk", flat=True)
+        )
+    elif action == "post_clear":
+        pks = instance.__dict__.pop("_cleared_incident_pks", [])
+        Incident.objects.refresh_type_caches(pks)
+    elif action in ("post_add", "post_remove"):
+        Incident.objects.refresh_type_caches(pk_set)
+
+
+@receiver(post_save, sender=IncidentType)
+@receiver(post_save, sender=SourceType)
+def refresh_renamed_type_caches(sender, instance, created, **kwargs):
+    """Pick up renamed incident and source types."""
+    if not created:
+        pks = instance.incident_set.values_list("pk", flat=True)
+        Incident.objects.refresh_type_caches(pks)
+
+
+@receiver(pre_delete, sender=IncidentType)
+@receiver(pre_delete, sender=SourceType)
+def remember_deleted_type_incidents(sender, instance, **kwargs):
+    # The M2M rows are deleted by cascade, without an m2m_changed signal.
+    instance._deleted_incident_pks = list(
+        instance.incident_set.values_list("pk", flat=True)
+    )
+
+
+@receiver(post_delete, sender=IncidentType)
+@receiver(post_delete, sender=SourceType)
+def refresh_deleted_type_caches(sender, instance, **kwargs):
+    pks = instance.__dict__.pop("_deleted_incident_pks", [])
+    Incident.objects.refresh_type_caches(pks)
@@ -1,3 +1,268 @@
-from django.test import TestCase
+import datetime
 
-# Create your tests here.
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, TestCase
+
+from .fields import PartialDate, PartialDateField
+from .management.commands.import_data import (
+    PACIFIC,
+    parse_last_modified,
+    split_address,
+    split_attachment,
+)
+from .models import Incident, IncidentType, Region, School, SchoolDistrict, SourceType
+
+
+class SplitAttachmentTestCase(SimpleTestCase):
+    def test_name_and_url(self):
+        self.assertEqual(
+            split_attachment("logo.png (https://dl.airtable.com/abc/logo.png)"),
+            ("logo.png", "https://dl.airtable.com/abc/logo.png"),
+        )
+
+    def test_parenthesized_name(self):
+        # AirTable URLs embed the file name, parentheses and all
+        self.assertEqual(
+            split_attachment("pic (1).jpg (https://dl.airtable.com/abc/pic_(1).jpg)"),
+            ("pic (1).jpg", "https://dl.airtable.com/abc/pic_(1).jpg"),
+        )
+
+    def test_missing_url(self):
+        with self.assertRaises(AssertionError):
+            split_attachment("logo.png")
+
+
+class SplitAddressTestCase(SimpleTestCase):
+    # Each shape, with what the old comma-counting cascade returned for it
+    def test_street_city_state_zip(self):
+        self.assertEqual(
+            split_address("123 Main St, New York, NY 10001"),
+            ("123 Main St", "New York", "NY", "10001"),
+        )
+
+    def test_street_city_comma_state_zip(self):
+        self.assertEqual(
+            split_address("123 Main St Seattle, WA 98101"),
+            ("123 Main St", "Seattle", "WA", "98101"),
+        )
+
+    def test_city_comma_state_zip(self):
+        self.assertEqual(
+            split_address("Seattle, WA 98101"), ("", "Seattle", "WA", "98101")
+        )
+
+    def test_street_comma_city_state_zip(self):
+        self.assertEqual(
+            split_address("123 Main St, Seattle WA 98101"),
+            ("123 Main St", "Seattle", "WA", "98101"),
+        )
+
+    def test_no_commas(self):
+        self.assertEqual(
+            split_address("123 Main St Seattle WA 98101"),
+            ("123 Main St", "Seattle", "WA", "98101"),
+        )
+        self.assertEqual(
+            split_address("Seattle WA 98101"), ("", "Seattle", "WA", "98101")
+        )
+        self.assertEqual(split_address("123 Main St"), ("", "123", "Main", "St"))
+
+    def test_surrounding_whitespace(self):
+        self.assertEqual(
+            split_address(" 123 Main St Seattle WA 98101 \t"),
+            ("123 Main St", "Seattle", "WA", "98101"),
+        )
+        self.assertEqual(
+            split_address("123 Main St, Seattle, WA 98101 "),
+            ("123 Main St", "Seattle", "WA", "98101"),
+        )
+
+    def test_unexpected_format(self):
+        for address in ("a, b, c, WA 98101", "a, b, WA", "Seattle WA"):
+            with self.subTest(address=address), self.assertRaises(AssertionError):
+                split_address(address)
+
+
+class ParseLastModifiedTestCase(SimpleTestCase):
+    def assertParses(self, value: str, expected: datetime.datetime):
+        self.assertEqual(parse_last_modified(value), expected.replace(tzinfo=PACIFIC))
+        # It accepts, and means, just what strptime() does
+        self.assertEqual(
+            datetime.datetime.strptime(value, "%m/%d/%Y %I:%M%p"), expected
+        )
+
+    def test_am_pm(self):
+        self.assertParses("3/14/2024 9:05am", datetime.datetime(2024, 3, 14, 9, 5))
+        self.assertParses("3/14/2024 9:05PM", datetime.datetime(2024, 3, 14, 21, 5))
+        self.assertParses("03/04/2024 11:59pm", datetime.datetime(2024, 3, 4, 23, 59))
+
+    def test_twelve_oclock(self):
+        self.assertParses("1/1/2024 12:00am", datetime.datetime(2024, 1, 1, 0, 0))
+        self.assertParses("1/1/2024 12:30pm", datetime.datetime(2024, 1, 1, 12, 30))
+
+    def test_whitespace_between_date_and_time(self):
+        self.assertParses("1/1/2024  9:05am", datetime.datetime(2024, 1, 1, 9, 5))
+        self.assertParses("1/1/2024\t9:05am", datetime.datetime(2024, 1, 1, 9, 5))
+
+    def test_invalid(self):
+        for value in (
+            "1/1/2024 0:05am",
+            "1/1/2024 13:05pm",
+            "1/1/2024 9:60am",
+            "1/1/2024 9:05",
+            "1/1/2024 9:05 am",
+            "1/1/24 9:05am",
+            "2/30/2024 9:05am",
+            "1/1/2024 9:05am ",
+        ):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_last_modified(value)
+                with self.assertRaises(ValueError):
+                    datetime.datetime.strptime(value, "%m/%d/%Y %I:%M%p")
+
+
+class PartialDateFromStrTestCase(SimpleTestCase):
+    def test_valid(self):
+        for value, parts in (
+            ("", (None, None, None)),
+            ("2024", (2024, None, None)),
+            ("2024-03", (2024, 3, None)),
+            ("2024-03-14", (2024, 3, 14)),
+            ("2024-02-29", (2024, 2, 29)),
+        ):
+            with self.subTest(value=value):
+                date = PartialDate.from_str(value)
+                self.assertEqual((date.year, date.month, date.day), parts)
+                self.assertEqual(str(date), value)
+
+    def test_invalid(self):
+        for value in (
+            "24",
+            "02024",
+            "2024-3",
+            "2024-03-1",
+            "2024/03/14",
+            "2024-03-14-01",
+            " 2024",
+            "2024\n",
+            "٢٠٢٤",
+            "1899",
+            "2024-13",
+            "2024-00",
+            "2023-02-29",
+            "2024-04-31",
+        ):
+            with self.subTest(value=value), self.assertRaises(ValidationError):
+                PartialDate.from_str(value)
+
+
+class PartialDateFromDbTestCase(SimpleTestCase):
+    VALUES = ("", "1900", "2024", "2024-03", "2024-12-31", "9999-02-28")
+
+    def test_matches_from_str(self):
+        # The trusted, unvalidated path agrees with from_str() on every value
+        # from_str() accepts
+        for value in self.VALUES:
+            with self.subTest(value=value):
+                date = PartialDate._from_db(value)
+                self.assertEqual(date, PartialDate.from_str(value))
+                self.assertEqual(str(date), value)
+
+    def test_field_round_trip(self):
+        field = PartialDateField()
+        for value in self.VALUES:
+            with self.subTest(value=value):
+                date = PartialDate.from_str(value)
+                stored = field.get_prep_value(date)
+                self.assertEqual(field.from_db_value(stored, None, None), date)
+
+
+class TypeCachesTestCase(TestCase):
+    """The signal handlers that keep incidents' type name caches in sync."""
+
+    @classmethod
+    def setUpTestData(cls):
+        region, _ = Region.objects.get_or_create_with_group("Seattle")
+        district = SchoolDistrict.objects.create(name="SPS")
+        school = School.objects.create(
+            name="Garfield",
+            district=district,
+            is_public=True,
+            is_elementary=False,
+            is_middle=False,
+            is_high=True,
+        )
+        cls.incidents = [
+            Incident.objects.create(
+                region=region,
+                school=school,
+                description=f"Incident {i}",
+                submitted_at=datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC),
+                occurred_at=PartialDate(2024, 1, None),
+            )
+            for i in range(2)
+        ]
+        cls.bullying = IncidentType.objects.create(name="Bullying")
+        cls.harassment = IncidentType.objects.create(name="Harassment")
+        cls.parent = SourceType.objects.create(name="Parent")
+        cls.student = SourceType.objects.create(name="Student")
+
+    def assertCaches(self, incident: Incident, incident_types: str, sources: str):
+        incident.refresh_from_db()
+        self.assertEqual(incident.incident_types_cache, incident_types)
+        self.assertEqual(incident.source_types_cache, sources)
+
+    def test_add_remove_clear(self):
+        incident = self.incidents[0]
+        incident.incident_types.add(self.harassment, self.bullying)
+        incident.source_types.add(self.student)
+        self.assertCaches(incident, "Bullying, Harassment", "Student")
+        incident.incident_types.remove(self.bullying)
+        self.assertCaches(incident, "Harassment", "Student")
+        incident.source_types.set([self.parent])
+        self.assertCaches(incident, "Harassment", "Parent")
+        incident.incident_types.clear()
+        incident.source_types.clear()
+        self.assertCaches(incident, "", "")
+
+    def test_reverse_add_remove(self):
+        first, second = self.incidents
+        self.bullying.incident_set.add(first, second)
+        self.student.incident_set.add(second)
+        self.assertCaches(first, "Bullying", "")
+        self.assertCaches(second, "Bullying", "Student")
+        self.bullying.incident_set.remove(first)
+        self.student.incident_set.remove(second)
+        self.assertCaches(first, "", "")
+        self.assertCaches(second, "Bullying", "")
+
+    def test_reverse_clear(self):
+        first, second = self.incidents
+        for incident in self.incidents:
+            incident.incident_types.set([self.bullying, self.harassment])
+            incident.source_types.set([self.parent])
+        self.bullying.incident_set.clear()
+        self.parent.incident_set.clear()
+        self.assertCaches(first, "Harassment", "")
+        self.assertCaches(second, "Harassment", "")
+
+    def test_rename(self):
+        incident = self.incidents[0]
+        incident.incident_types.set([self.bullying, self.harassment])
+        incident.source_types.set([self.parent])
+        self.harassment.name = "Assault"
+        self.harassment.save()
+        self.parent.name = "Guardian"
+        self.parent.save()
+        self.assertCaches(incident, "Assault, Bullying", "Guardian")
+
+    def test_delete(self):
+        first, second = self.incidents
+        for incident in self.incidents:
+            incident.incident_types.set([self.bullying, self.harassment])
+            incident.source_types.set([self.parent, self.student])
+        self.bullying.delete()
+        self.student.delete()
+        self.assertCaches(first, "Harassment", "Parent")
+        self.assertCaches(second, "Harassment", "Parent")
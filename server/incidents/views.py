@@ -1,37 +1,53 @@
-from django.contrib.contenttypes.models import ContentType
+from django.apps import apps
 from django.http import Http404, HttpRequest, HttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import quote_etag
 
 from .kebab import kebab_to_pascal
-from .models import AttachmentBase
+from .models import AttachmentBase, hash_attachment_data
+
+# How long, in seconds, clients may use a cached attachment without asking
+ATTACHMENT_MAX_AGE = 60 * 60
 
 
 def attachment(request: HttpRequest, klass: str, pk: int, name: str):
     """Serve an attachment by grabbing its binary content from the database."""
-    print("INSIDE attachment")
     # Convert `klass` from kebab-case to PascalCase.
     model = kebab_to_pascal(klass).lower()
 
-    print("model:", model)
-
-    # Get the attachment model based on `klass`.
-    content_type = get_object_or_404(ContentType, app_label="incidents", model=model)
-
-    print("content_type:", content_type)
-    model_klass = content_type.model_class()
-    print("model_klass:", model_klass)
-    if model_klass is None:
-        raise Http404()
+    # Get the attachment model based on `klass`, from the app registry rather
+    # than the ContentType table; it's in memory, so this costs no query.
+    try:
+        model_klass = apps.get_model("incidents", model)
+    except LookupError:
+        raise Http404() from None
 
     # Make sure that the model_klass derives from AttachmentBase.
     if not issubclass(model_klass, AttachmentBase):
         raise Http404()
 
-    # Attempt to get the attachment.
-    a = get_object_or_404(model_klass, pk=pk)
-
-    # Verify the name.
-    if a.name != name:
-        raise Http404()
-
-    return HttpResponse(a.data, content_type=a.content_type)
+    # Attempt to get the attachment, verifying its name in the same query, so
+    # that a mismatched name never pulls the binary content out of the database.
+    # A revalidation is checked against the stored hash before the content is
+    # read, so only a request that will send the content loads it up front.
+    revalidating = "HTTP_IF_NONE_MATCH" in request.META
+    queryset = model_klass.objects.all()
+    if not revalidating:
+        queryset = queryset.with_data()
+    a = get_object_or_404(queryset, pk=pk, name=name)
+
+    # The URL doesn't pin down the content (a new file can be uploaded under
+    # the same name), so let clients keep a copy for a while, and then
+    # revalidate it against an ETag, which is answered with an empty 304.
+    response = HttpResponse(content_type=a.content_type)
+    response["ETag"] = quote_etag(a.data_hash or hash_attachment_data(a.data))
+    patch_cache_control(response, max_age=ATTACHMENT_MAX_AGE)
+    conditional_response = get_conditional_response(
+        request, etag=response["ETag"], response=response
+    )
+    if conditional_response is not response:
+        return conditional_response
+    # Loads the content now, if it was deferred
+    response.content = a.data
+    return response
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 
 import os
 from pathlib import Path
+from urllib.parse import urlsplit
 
 from dj_database_url import parse as db_url
 
@@ -34,9 +35,10 @@ DEBUG = os.getenv("DEBUG", "False") == "True"
 
 ALLOWED_HOSTS = []
 if not DEBUG:
-    ALLOWED_HOSTS = [
-        BASE_URL.replace("http://", "").replace("https://", "").split(":")[0]
-    ]
+    ALLOWED_HOSTS = [urlsplit(BASE_URL).hostname]
+
+# Heroku's router terminates TLS and reports the original scheme in this header
+SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
 
 # Application definition
@@ -95,8 +97,11 @@ WSGI_APPLICATION = "server.wsgi.application"
 
 DATABASE_URL = os.environ["DATABASE_URL"]
 
+# Keep each worker's connection open between requests, rather than paying
+# for a fresh connection (and, on Heroku, a TLS handshake) on every one.
+# Health checks replace connections that the database has dropped.
 DATABASES = {
-    "default": db_url(DATABASE_URL),
+    "default": db_url(DATABASE_URL, conn_max_age=600, conn_health_checks=True),
 }
 
 
@@ -126,7 +131,8 @@ LANGUAGE_CODE = "en-us"
 
 TIME_ZONE = "UTC"
 
-USE_I18N = True
+# The app (admin included) is English-only, so skip the translation machinery.
+USE_I18N = False
 
 USE_TZ = True
 
@@ -156,7 +162,6 @@ WHITENOISE_KEEP_ONLY_HASHED_FILES = True
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
 
-DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 PHONENUMBER_DEFAULT_REGION = "US"